@@ -1,21 +1,75 @@
+import functools
 import os
 import sqlite3
+import threading
 import tkinter as tk
+from contextlib import contextmanager
 from tkinter import messagebox, ttk
 
 
 DB_FILE = "printer_service.db"
-
-
-def get_connection():
-    conn = sqlite3.connect(DB_FILE)
-    conn.execute("PRAGMA foreign_keys = ON;")
-    return conn
+LOG_PAGE_SIZE = 200  # logs are loaded into the tree one page at a time
+
+_CONN = None
+
+
+def get_connection():
+    # One long-lived connection shared by every helper; opened lazily so that
+    # DB_FILE can still be changed (e.g. by tests) before first use. It belongs
+    # to the thread that opens it (the Tk thread); sqlite3 enforces that.
+    global _CONN
+    if _CONN is None:
+        conn = sqlite3.connect(DB_FILE, isolation_level=None)
+        # Connection-lifetime settings: issued once here, never per query
+        conn.execute("PRAGMA foreign_keys = ON;")
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute("PRAGMA temp_store = MEMORY;")
+        conn.execute("PRAGMA cache_size = -64000;")
+        conn.execute("PRAGMA mmap_size = 268435456;")
+        _CONN = conn
+    return _CONN
+
+
+def reset_connection():
+    global _CONN
+    if _CONN is not None:
+        _CONN.close()
+        _CONN = None
+
+
+@contextmanager
+def transaction(immediate=False, conn=None):
+    conn = conn or get_connection()
+    if conn.in_transaction:
+        # Nested use joins the outer transaction
+        yield conn
+        return
+    conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        # Also covers a failed COMMIT, which can leave the transaction open
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
 
 
 def initialize_database():
     os.makedirs(os.path.dirname(os.path.abspath(DB_FILE)), exist_ok=True)
-    with get_connection() as conn:
+    # A private connection, so this can run on a worker thread without touching
+    # the shared one; WAL lets the Tk thread's connection work alongside it.
+    conn = sqlite3.connect(DB_FILE, isolation_level=None)
+    try:
+        _create_schema(conn)
+    finally:
+        conn.close()
+
+
+def _create_schema(conn):
+    # journal_mode is stored in the database file, so it only needs setting here
+    conn.execute("PRAGMA journal_mode = WAL;")
+    with transaction(conn=conn):
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS printers (
@@ -41,12 +95,21 @@ def initialize_database():
             );
             """
         )
+        # printer_id lookups are already served by the UNIQUE constraint's index.
+        # The id tie-breaker keeps log pages stable and sort-free.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_logs_printer_created_id ON service_logs(printer_id_fk, created_at DESC, id DESC);"
+        )
         # Migrate existing DBs by adding missing columns
-        cols = {row[1] for row in conn.execute("PRAGMA table_info(printers)").fetchall()}
-        if "nozzle_type" not in cols:
-            conn.execute("ALTER TABLE printers ADD COLUMN nozzle_type TEXT;")
-        if "ams" not in cols:
-            conn.execute("ALTER TABLE printers ADD COLUMN ams INTEGER DEFAULT 0;")
+        for ddl in (
+            "ALTER TABLE printers ADD COLUMN nozzle_type TEXT;",
+            "ALTER TABLE printers ADD COLUMN ams INTEGER DEFAULT 0;",
+        ):
+            try:
+                conn.execute(ddl)
+            except sqlite3.OperationalError as e:
+                if "duplicate column" not in str(e):
+                    raise
 
 
 def _coerce_hours(hours):
@@ -56,109 +119,151 @@ def _coerce_hours(hours):
         raise ValueError("Hours must be an integer")
 
 
+_SELECT_PRINTERS = "SELECT id, printer_id, name, manufacturer, model, hours, nozzle_type, ams FROM printers"
+# Fixed SQL text per sort order so sqlite3's statement cache reuses the plan
+_FETCH_PRINTERS_SQL = {
+    None: f"{_SELECT_PRINTERS} ORDER BY name",
+    "asc": f"{_SELECT_PRINTERS} ORDER BY hours ASC, name",
+    "desc": f"{_SELECT_PRINTERS} ORDER BY hours DESC, name",
+}
+
+
 def db_fetch_printers(sort_hours=None):
-    with get_connection() as conn:
-        order_clause = "ORDER BY name"
-        if sort_hours == "asc":
-            order_clause = "ORDER BY hours ASC, name"
-        elif sort_hours == "desc":
-            order_clause = "ORDER BY hours DESC, name"
-        rows = conn.execute(
-            f"SELECT id, printer_id, name, manufacturer, model, hours, nozzle_type, ams FROM printers {order_clause}"
-        ).fetchall()
-        return rows
+    conn = get_connection()
+    sql = _FETCH_PRINTERS_SQL.get(sort_hours, _FETCH_PRINTERS_SQL[None])
+    rows = conn.execute(sql).fetchall()
+    return rows
+
+
+def db_data_version():
+    # Changes whenever another connection commits to the database file
+    return get_connection().execute("PRAGMA data_version").fetchone()[0]
+
+
+def _printer_params(printer_id, name, manufacturer, model, hours, nozzle_type, ams):
+    return (
+        printer_id.strip(),
+        name.strip(),
+        manufacturer.strip(),
+        model.strip(),
+        _coerce_hours(hours),
+        (nozzle_type or "").strip(),
+        1 if ams else 0,
+    )
 
 
 def db_insert_printer(printer_id, name, manufacturer, model, hours, nozzle_type, ams):
-    hours_val = _coerce_hours(hours)
-    with get_connection() as conn:
-        conn.execute(
+    db_insert_printers_many([(printer_id, name, manufacturer, model, hours, nozzle_type, ams)])
+
+
+def db_insert_printers_many(rows):
+    # rows: iterable of (printer_id, name, manufacturer, model, hours, nozzle_type, ams)
+    params = [_printer_params(*row) for row in rows]
+    with transaction(immediate=True) as conn:
+        conn.executemany(
             "INSERT INTO printers (printer_id, name, manufacturer, model, hours, nozzle_type, ams) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (
-                printer_id.strip(),
-                name.strip(),
-                manufacturer.strip(),
-                model.strip(),
-                hours_val,
-                (nozzle_type or "").strip(),
-                1 if ams else 0,
-            ),
+            params,
         )
 
 
 def db_update_printer(db_id, printer_id, name, manufacturer, model, hours, nozzle_type, ams):
-    hours_val = _coerce_hours(hours)
-    with get_connection() as conn:
+    params = _printer_params(printer_id, name, manufacturer, model, hours, nozzle_type, ams)
+    with transaction() as conn:
         conn.execute(
             """
             UPDATE printers
             SET printer_id = ?, name = ?, manufacturer = ?, model = ?, hours = ?, nozzle_type = ?, ams = ?
             WHERE id = ?
             """,
-            (
-                printer_id.strip(),
-                name.strip(),
-                manufacturer.strip(),
-                model.strip(),
-                hours_val,
-                (nozzle_type or "").strip(),
-                1 if ams else 0,
-                db_id,
-            ),
+            params + (db_id,),
         )
+    return (db_id,) + params
 
 
 def db_delete_printer(db_id):
-    with get_connection() as conn:
+    with transaction() as conn:
         conn.execute("DELETE FROM printers WHERE id = ?", (db_id,))
 
 
 def db_get_printer_by_db_id(db_id):
-    with get_connection() as conn:
-        row = conn.execute(
-            """
-            SELECT printer_id, name, manufacturer, model, hours, nozzle_type, ams
-            FROM printers WHERE id = ?
-            """,
-            (db_id,),
-        ).fetchone()
-        return row
+    conn = get_connection()
+    row = conn.execute(
+        """
+        SELECT printer_id, name, manufacturer, model, hours, nozzle_type, ams
+        FROM printers WHERE id = ?
+        """,
+        (db_id,),
+    ).fetchone()
+    return row
 
 
 def ensure_unique_printer_id(base_printer_id):
     base = base_printer_id.strip() or "printer"
+    conn = get_connection()
+    # Fetch the base id and every "<base>-..." id in one range scan over the
+    # UNIQUE index ("." sorts right after "-"), then probe candidates in Python.
+    taken = {
+        row[0]
+        for row in conn.execute(
+            "SELECT printer_id FROM printers WHERE printer_id = ? OR (printer_id >= ? AND printer_id < ?)",
+            (base, f"{base}-", f"{base}."),
+        )
+    }
     candidate = base
     idx = 1
-    with get_connection() as conn:
-        while True:
-            exists = conn.execute(
-                "SELECT 1 FROM printers WHERE printer_id = ? LIMIT 1", (candidate,)
-            ).fetchone()
-            if not exists:
-                return candidate
-            idx += 1
-            candidate = f"{base}-{idx}"
-
-
-def db_fetch_logs_for(db_id):
-    with get_connection() as conn:
-        rows = conn.execute(
-            "SELECT id, created_at, note FROM service_logs WHERE printer_id_fk = ? ORDER BY created_at DESC",
-            (db_id,),
-        ).fetchall()
-        return rows
+    while candidate in taken:
+        idx += 1
+        candidate = f"{base}-{idx}"
+    return candidate
+
+
+def db_duplicate_printer(db_id):
+    # Read, pick a free id and insert under one write lock and one commit
+    with transaction(immediate=True):
+        row = db_get_printer_by_db_id(db_id)
+        if not row:
+            return None
+        src_printer_id, name, manufacturer, model, hours, nozzle_type, ams = row
+        new_printer_id = ensure_unique_printer_id(f"{src_printer_id}-copy")
+        db_insert_printer(
+            new_printer_id,
+            (name or "").strip() + " (Copy)",
+            manufacturer or "",
+            model or "",
+            hours or 0,
+            nozzle_type or "",
+            bool(ams),
+        )
+        return new_printer_id
+
+
+_FETCH_LOGS_SQL = (
+    "SELECT id, created_at, note FROM service_logs WHERE printer_id_fk = ? "
+    "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+)
+
+
+def db_fetch_logs_for(db_id, limit=-1, offset=0):
+    conn = get_connection()
+    rows = conn.execute(_FETCH_LOGS_SQL, (db_id, limit, offset)).fetchall()
+    return rows
 
 
 def db_insert_log(db_id, note):
-    with get_connection() as conn:
-        conn.execute(
+    db_insert_logs_many(db_id, [note])
+
+
+def db_insert_logs_many(db_id, notes):
+    params = [(db_id, note.strip()) for note in notes]
+    with transaction(immediate=True) as conn:
+        conn.executemany(
             "INSERT INTO service_logs (printer_id_fk, note) VALUES (?, ?)",
-            (db_id, note.strip()),
+            params,
         )
 
 
 def db_update_log(log_id, note):
-    with get_connection() as conn:
+    with transaction() as conn:
         conn.execute(
             "UPDATE service_logs SET note = ? WHERE id = ?",
             (note.strip(), log_id),
@@ -166,25 +271,89 @@ def db_update_log(log_id, note):
 
 
 def db_delete_log(log_id):
-    with get_connection() as conn:
+    with transaction() as conn:
         conn.execute("DELETE FROM service_logs WHERE id = ?", (log_id,))
 
 
 class PrinterServiceApp(tk.Tk):
+    # Text fields of the details form, in the order the printer helpers take them
+    FORM_FIELDS = (
+        ("printer_id", "Printer ID:"),
+        ("name", "Name:"),
+        ("manufacturer", "Manufacturer:"),
+        ("model", "Model:"),
+        ("hours", "Hours:"),
+        ("nozzle_type", "Nozzle Type:"),
+    )
+
     def __init__(self):
         super().__init__()
         self.title("Printer Service Logger")
         self.geometry("1180x720")
         self.minsize(1050, 600)
         self.configure(padx=8, pady=8)
+        # Dialog sizes below are in 96-DPI pixels; scale them once for high-DPI screens
+        self._dpi_scale = max(1.0, self.winfo_fpixels("1i") / 96.0)
 
         self.sort_hours = None  # None | 'asc' | 'desc'
+        self._logs_db_id = None  # printer whose logs are paged into logs_tree
+        self._log_rows = {}  # iid -> values currently shown in logs_tree, in order
+        self._logs_exhausted = True
+        self._printer_rows = {}  # iid -> values currently shown in printer_tree, in order
+        self._printers_shown = None  # fetch_printers() result the tree reflects
+        self._printers_cache = None
+        self._printers_cache_key = None
+        self._printers_dirty = True
+        # Recently viewed log pages, keyed by (db_id, limit, offset, data_version)
+        self._logs_cache = functools.lru_cache(maxsize=64)(
+            lambda db_id, limit, offset, data_version: db_fetch_logs_for(db_id, limit, offset)
+        )
+        self._current_db_id = None  # selected printer, tracked by on_select_printer
 
         self._build_ui()
-        self.refresh_printers()
+
+    def initialize_in_background(self):
+        # Open/migrate the database off the Tk thread so the window shows at once.
+        # Tk calls must stay on this thread, so poll for completion with after().
+        # DB-backed buttons stay disabled until the schema is ready.
+        self._set_db_buttons_enabled(False)
+        done = threading.Event()
+        errors = []
+
+        def worker():
+            try:
+                initialize_database()
+            except Exception as e:
+                errors.append(e)
+            finally:
+                done.set()
+
+        def poll():
+            if not done.is_set():
+                self.after(20, poll)
+            elif errors:
+                messagebox.showerror("Error", f"Could not open database: {errors[0]}")
+            else:
+                self._set_db_buttons_enabled(True)
+                self.refresh_printers()
+
+        threading.Thread(target=worker, daemon=True).start()
+        poll()
+
+    def _set_db_buttons_enabled(self, enabled):
+        for btn in self._db_buttons:
+            btn.state(["!disabled"] if enabled else ["disabled"])
 
     # UI construction
     def _build_ui(self):
+        # Buttons that hit the database; disabled while it is being initialised
+        self._db_buttons = []
+
+        def db_button(parent, **kwargs):
+            btn = ttk.Button(parent, **kwargs)
+            self._db_buttons.append(btn)
+            return btn
+
         # Split into left (list) and right (form + logs)
         container = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
         container.pack(fill=tk.BOTH, expand=True)
@@ -221,10 +390,10 @@ class PrinterServiceApp(tk.Tk):
         btns_frame.pack(fill=tk.X, pady=(6, 0))
         ttk.Button(btns_frame, text="Add", command=self.add_printer_dialog).pack(side=tk.LEFT)
         ttk.Button(btns_frame, text="Edit", command=self.edit_selected_printer).pack(side=tk.LEFT, padx=6)
-        ttk.Button(btns_frame, text="Delete", command=self.delete_selected_printer).pack(side=tk.LEFT)
-        ttk.Button(btns_frame, text="Hours ▲", command=lambda: self.set_sort_hours('asc')).pack(side=tk.LEFT, padx=(12, 0))
-        ttk.Button(btns_frame, text="Hours ▼", command=lambda: self.set_sort_hours('desc')).pack(side=tk.LEFT, padx=(6, 0))
-        ttk.Button(btns_frame, text="Refresh", command=self.refresh_printers).pack(side=tk.RIGHT)
+        db_button(btns_frame, text="Delete", command=self.delete_selected_printer).pack(side=tk.LEFT)
+        db_button(btns_frame, text="Hours ▲", command=lambda: self.set_sort_hours('asc')).pack(side=tk.LEFT, padx=(12, 0))
+        db_button(btns_frame, text="Hours ▼", command=lambda: self.set_sort_hours('desc')).pack(side=tk.LEFT, padx=(6, 0))
+        db_button(btns_frame, text="Refresh", command=self.refresh_printers).pack(side=tk.RIGHT)
 
         # Right pane: details + logs
         right_frame = ttk.Frame(container)
@@ -234,12 +403,7 @@ class PrinterServiceApp(tk.Tk):
         form = ttk.LabelFrame(right_frame, text="Printer Details")
         form.pack(fill=tk.X)
 
-        self.var_printer_id = tk.StringVar()
-        self.var_name = tk.StringVar()
-        self.var_manufacturer = tk.StringVar()
-        self.var_model = tk.StringVar()
-        self.var_hours = tk.StringVar()
-        self.var_nozzle_type = tk.StringVar()
+        self.vars = {name: tk.StringVar() for name, _ in self.FORM_FIELDS}
         self.var_ams = tk.BooleanVar()
 
         def add_row(row, label, entry_var, width=40):
@@ -248,19 +412,18 @@ class PrinterServiceApp(tk.Tk):
             e.grid(row=row, column=1, padx=6, pady=6, sticky=tk.W)
             return e
 
-        self.entry_printer_id = add_row(0, "Printer ID:", self.var_printer_id)
-        self.entry_name = add_row(1, "Name:", self.var_name)
-        self.entry_manufacturer = add_row(2, "Manufacturer:", self.var_manufacturer)
-        self.entry_model = add_row(3, "Model:", self.var_model)
-        self.entry_hours = add_row(4, "Hours:", self.var_hours)
-        self.entry_nozzle = add_row(5, "Nozzle Type:", self.var_nozzle_type)
-        ttk.Label(form, text="AMS:").grid(row=6, column=0, padx=6, pady=6, sticky=tk.E)
-        ttk.Checkbutton(form, variable=self.var_ams).grid(row=6, column=1, padx=6, pady=6, sticky=tk.W)
+        self.entries = {
+            name: add_row(row, label, self.vars[name])
+            for row, (name, label) in enumerate(self.FORM_FIELDS)
+        }
+        ams_row = len(self.FORM_FIELDS)
+        ttk.Label(form, text="AMS:").grid(row=ams_row, column=0, padx=6, pady=6, sticky=tk.E)
+        ttk.Checkbutton(form, variable=self.var_ams).grid(row=ams_row, column=1, padx=6, pady=6, sticky=tk.W)
 
         form_btns = ttk.Frame(form)
-        form_btns.grid(row=0, column=2, rowspan=7, padx=6, pady=6, sticky=tk.N)
-        ttk.Button(form_btns, text="Save As New", command=self.save_as_new_printer).pack(fill=tk.X)
-        ttk.Button(form_btns, text="Update Selected", command=self.update_selected_printer).pack(fill=tk.X, pady=6)
+        form_btns.grid(row=0, column=2, rowspan=ams_row + 1, padx=6, pady=6, sticky=tk.N)
+        db_button(form_btns, text="Save As New", command=self.save_as_new_printer).pack(fill=tk.X)
+        db_button(form_btns, text="Update Selected", command=self.update_selected_printer).pack(fill=tk.X, pady=6)
         ttk.Button(form_btns, text="Clear Form", command=self.clear_form).pack(fill=tk.X)
 
         # Logs section
@@ -268,7 +431,11 @@ class PrinterServiceApp(tk.Tk):
         logs.pack(fill=tk.BOTH, expand=True, pady=(8, 0))
 
         self.logs_tree = ttk.Treeview(
-            logs, columns=("created_at", "note"), show="headings", selectmode="browse"
+            logs,
+            columns=("created_at", "note"),
+            show="headings",
+            selectmode="browse",
+            yscrollcommand=self._on_logs_scrolled,
         )
         self.logs_tree.heading("created_at", text="Date")
         self.logs_tree.heading("note", text="Note / Task")
@@ -278,22 +445,33 @@ class PrinterServiceApp(tk.Tk):
 
         logs_btns = ttk.Frame(logs)
         logs_btns.pack(fill=tk.X, pady=(6, 0))
-        ttk.Button(logs_btns, text="Add Note", command=self.add_log_dialog).pack(side=tk.LEFT)
-        ttk.Button(logs_btns, text="Edit Note", command=self.edit_selected_log).pack(side=tk.LEFT, padx=6)
-        ttk.Button(logs_btns, text="Delete Note", command=self.delete_selected_log).pack(side=tk.LEFT)
-        ttk.Button(logs_btns, text="Refresh", command=self.refresh_logs).pack(side=tk.RIGHT)
+        db_button(logs_btns, text="Add Note", command=self.add_log_dialog).pack(side=tk.LEFT)
+        db_button(logs_btns, text="Edit Note", command=self.edit_selected_log).pack(side=tk.LEFT, padx=6)
+        db_button(logs_btns, text="Delete Note", command=self.delete_selected_log).pack(side=tk.LEFT)
+        db_button(logs_btns, text="Refresh", command=self.refresh_logs).pack(side=tk.RIGHT)
 
     # DB helpers
     def fetch_printers(self):
-        return db_fetch_printers(self.sort_hours)
+        # Reuse the last result until we write to printers, the sort changes,
+        # or another connection commits
+        key = (self.sort_hours, db_data_version())
+        if self._printers_dirty or key != self._printers_cache_key:
+            self._printers_cache = db_fetch_printers(self.sort_hours)
+            self._printers_cache_key = key
+            self._printers_dirty = False
+        return self._printers_cache
 
     def insert_printer(self, printer_id, name, manufacturer, model, hours, nozzle_type, ams):
+        self._printers_dirty = True
         db_insert_printer(printer_id, name, manufacturer, model, hours, nozzle_type, ams)
 
     def update_printer(self, db_id, printer_id, name, manufacturer, model, hours, nozzle_type, ams):
-        db_update_printer(db_id, printer_id, name, manufacturer, model, hours, nozzle_type, ams)
+        self._printers_dirty = True
+        return db_update_printer(db_id, printer_id, name, manufacturer, model, hours, nozzle_type, ams)
 
     def delete_printer(self, db_id):
+        self._printers_dirty = True
+        self._logs_cache.cache_clear()
         db_delete_printer(db_id)
 
     def get_printer_by_db_id(self, db_id):
@@ -302,83 +480,133 @@ class PrinterServiceApp(tk.Tk):
     def ensure_unique_printer_id(self, base_printer_id):
         return ensure_unique_printer_id(base_printer_id)
 
-    def fetch_logs_for(self, db_id):
-        return db_fetch_logs_for(db_id)
+    def duplicate_printer(self, db_id):
+        self._printers_dirty = True
+        return db_duplicate_printer(db_id)
+
+    def fetch_logs_for(self, db_id, limit=-1, offset=0):
+        return self._logs_cache(db_id, limit, offset, db_data_version())
 
     def insert_log(self, db_id, note):
+        self._logs_cache.cache_clear()
         db_insert_log(db_id, note)
 
     def update_log(self, log_id, note):
+        self._logs_cache.cache_clear()
         db_update_log(log_id, note)
 
     def delete_log(self, log_id):
+        self._logs_cache.cache_clear()
         db_delete_log(log_id)
 
     # UI actions
     def refresh_printers(self):
-        for item in self.printer_tree.get_children():
-            self.printer_tree.delete(item)
-        for row in self.fetch_printers():
-            db_id, printer_id, name, manufacturer, model, hours, nozzle_type, ams = row
-            self.printer_tree.insert(
-                "",
-                tk.END,
-                iid=str(db_id),
-                values=(
-                    printer_id,
-                    name,
-                    manufacturer or "",
-                    model or "",
-                    hours or 0,
-                    nozzle_type or "",
-                    "Yes" if (ams or 0) else "No",
-                ),
-            )
+        printers = self.fetch_printers()
+        if printers is not self._printers_shown:
+            self._sync_printer_tree(printers)
+            self._printers_shown = printers
         self.on_select_printer()
 
+    @staticmethod
+    def _printer_values(row):
+        db_id, printer_id, name, manufacturer, model, hours, nozzle_type, ams = row
+        return (
+            printer_id,
+            name,
+            manufacturer or "",
+            model or "",
+            hours or 0,
+            nozzle_type or "",
+            "Yes" if ams else "No",
+        )
+
+    @staticmethod
+    def _sync_tree(tree, shown, rows):
+        # Diff two {iid: values} snapshots so only changed rows cost Tcl calls
+        removed = shown.keys() - rows.keys()
+        if removed:
+            tree.delete(*removed)
+        order = list(rows)
+        # If the surviving rows kept their relative order, new rows can be
+        # inserted straight at their final index and nothing needs reordering
+        in_place = [iid for iid in shown if iid in rows] == [iid for iid in order if iid in shown]
+        # Bind hot-loop lookups to locals
+        insert, item, end = tree.insert, tree.item, tk.END
+        for index, iid in enumerate(order):
+            values = rows[iid]
+            old = shown.get(iid)
+            if old is None:
+                insert("", index if in_place else end, iid=iid, values=values)
+            elif old != values:
+                item(iid, values=values)
+        if not in_place:
+            tree.set_children("", *order)
+
+    def _sync_printer_tree(self, printers):
+        printer_values = self._printer_values
+        rows = {str(row[0]): printer_values(row) for row in printers}
+        self._sync_tree(self.printer_tree, self._printer_rows, rows)
+        self._printer_rows = rows
+
+    def _apply_printer_edit(self, row):
+        # Patch one edited row in place; returns False when a full refresh is needed
+        printers = self._printers_cache
+        if printers is None or printers is not self._printers_shown:
+            return False
+        db_id = row[0]
+        index = next((i for i, old in enumerate(printers) if old[0] == db_id), None)
+        if index is None:
+            return False
+        old = printers[index]
+        # name and hours drive the sort order
+        if old[2] != row[2] or old[5] != row[5]:
+            return False
+        iid = str(db_id)
+        values = self._printer_values(row)
+        self.printer_tree.item(iid, values=values)
+        self._printer_rows[iid] = values
+        printers = list(printers)
+        printers[index] = row
+        self._printers_cache = self._printers_shown = printers
+        self._printers_dirty = False
+        return True
+
     def on_select_printer(self):
         selection = self.printer_tree.selection()
         if not selection:
+            self._current_db_id = None
             self.clear_form()
             self.clear_logs()
             return
         iid = selection[0]
-        values = self.printer_tree.item(iid, "values")
-        self.var_printer_id.set(values[0])
-        self.var_name.set(values[1])
-        self.var_manufacturer.set(values[2])
-        self.var_model.set(values[3])
-        self.var_hours.set(str(values[4]))
-        self.var_nozzle_type.set(values[5])
-        self.var_ams.set(True if str(values[6]).lower() == "yes" else False)
+        self._current_db_id = int(iid)
+        self._fill_form(self._printer_rows[iid])
         self.refresh_logs()
 
+    def _fill_form(self, values):
+        # values: a printer row as shown in printer_tree
+        *field_values, ams = values
+        for (name, _), value in zip(self.FORM_FIELDS, field_values):
+            self.vars[name].set(str(value))
+        self.var_ams.set(ams == "Yes")
+
     def clear_form(self):
-        self.var_printer_id.set("")
-        self.var_name.set("")
-        self.var_manufacturer.set("")
-        self.var_model.set("")
-        self.var_hours.set("")
-        self.var_nozzle_type.set("")
+        for var in self.vars.values():
+            var.set("")
         self.var_ams.set(False)
 
+    def _form_values(self):
+        # Form contents in the argument order of insert_printer/update_printer
+        return tuple(self.vars[name].get() for name, _ in self.FORM_FIELDS) + (self.var_ams.get(),)
+
     def get_selected_printer_db_id(self):
-        selection = self.printer_tree.selection()
-        return int(selection[0]) if selection else None
+        return self._current_db_id
 
     def save_as_new_printer(self):
         try:
-            self.insert_printer(
-                self.var_printer_id.get(),
-                self.var_name.get(),
-                self.var_manufacturer.get(),
-                self.var_model.get(),
-                self.var_hours.get(),
-                self.var_nozzle_type.get(),
-                self.var_ams.get(),
-            )
-            self.refresh_printers()
+            self.insert_printer(*self._form_values())
             messagebox.showinfo("Success", "Printer added.")
+            self.after_idle(self.refresh_printers)
         except sqlite3.IntegrityError as e:
             messagebox.showerror("Error", f"Integrity error: {e}")
         except Exception as e:
@@ -390,18 +618,14 @@ class PrinterServiceApp(tk.Tk):
             messagebox.showwarning("No selection", "Please select a printer to update.")
             return
         try:
-            self.update_printer(
-                db_id,
-                self.var_printer_id.get(),
-                self.var_name.get(),
-                self.var_manufacturer.get(),
-                self.var_model.get(),
-                self.var_hours.get(),
-                self.var_nozzle_type.get(),
-                self.var_ams.get(),
-            )
-            self.refresh_printers()
+            row = self.update_printer(db_id, *self._form_values())
+            patched = self._apply_printer_edit(row)
+            if patched:
+                # Show the stored (normalised) values, as a full refresh would
+                self._fill_form(self._printer_rows[str(db_id)])
             messagebox.showinfo("Updated", "Printer updated.")
+            if not patched:
+                self.after_idle(self.refresh_printers)
         except sqlite3.IntegrityError as e:
             messagebox.showerror("Error", f"Integrity error: {e}")
         except Exception as e:
@@ -413,14 +637,14 @@ class PrinterServiceApp(tk.Tk):
 
     def add_printer_dialog(self):
         self.clear_form()
-        self.entry_printer_id.focus_set()
+        self.entries["printer_id"].focus_set()
 
     def edit_selected_printer(self):
         # Form already reflects selection; just ensure something is selected
         if not self.get_selected_printer_db_id():
             messagebox.showwarning("No selection", "Select a printer to edit.")
             return
-        self.entry_name.focus_set()
+        self.entries["name"].focus_set()
 
     def delete_selected_printer(self):
         db_id = self.get_selected_printer_db_id()
@@ -431,8 +655,8 @@ class PrinterServiceApp(tk.Tk):
             return
         try:
             self.delete_printer(db_id)
-            self.refresh_printers()
             messagebox.showinfo("Deleted", "Printer removed.")
+            self.after_idle(self.refresh_printers)
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
@@ -440,6 +664,8 @@ class PrinterServiceApp(tk.Tk):
         iid = self.printer_tree.identify_row(event.y)
         if iid:
             self.printer_tree.selection_set(iid)
+            # The menu command may run before <<TreeviewSelect>> is delivered
+            self._current_db_id = int(iid)
             try:
                 self.printer_menu.tk_popup(event.x_root, event.y_root)
             finally:
@@ -451,48 +677,59 @@ class PrinterServiceApp(tk.Tk):
             messagebox.showwarning("No selection", "Select a printer to duplicate.")
             return
         try:
-            row = self.get_printer_by_db_id(db_id)
-            if not row:
+            new_printer_id = self.duplicate_printer(db_id)
+            if not new_printer_id:
                 messagebox.showerror("Error", "Selected printer not found.")
                 return
-            src_printer_id, name, manufacturer, model, hours, nozzle_type, ams = row
-            new_printer_id = self.ensure_unique_printer_id(f"{src_printer_id}-copy")
-            new_name = (name or "").strip() + " (Copy)"
-            self.insert_printer(
-                new_printer_id,
-                new_name,
-                manufacturer or "",
-                model or "",
-                hours or 0,
-                nozzle_type or "",
-                bool(ams),
-            )
-            self.refresh_printers()
             messagebox.showinfo("Duplicated", f"Printer duplicated as {new_printer_id}.")
+            self.after_idle(self.refresh_printers)
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
     # Logs
     def clear_logs(self):
-        for item in self.logs_tree.get_children():
-            self.logs_tree.delete(item)
+        if self._log_rows:
+            self.logs_tree.delete(*self._log_rows)
+        self._log_rows = {}
+        self._logs_db_id = None
+        self._logs_exhausted = True
 
     def refresh_logs(self):
-        self.clear_logs()
         db_id = self.get_selected_printer_db_id()
+        if db_id != self._logs_db_id:
+            self.clear_logs()
+            self._logs_db_id = db_id
         if not db_id:
             return
-        for log_id, created_at, note in self.fetch_logs_for(db_id):
-            self.logs_tree.insert("", tk.END, iid=f"log-{log_id}", values=(created_at, note))
+        # Re-read as many logs as are already shown and apply only the difference
+        limit = max(len(self._log_rows), LOG_PAGE_SIZE)
+        logs = self.fetch_logs_for(db_id, limit)
+        rows = {str(log_id): (created_at, note) for log_id, created_at, note in logs}
+        self._sync_tree(self.logs_tree, self._log_rows, rows)
+        self._log_rows = rows
+        self._logs_exhausted = len(logs) < limit
+
+    def _load_more_logs(self):
+        logs = self.fetch_logs_for(self._logs_db_id, LOG_PAGE_SIZE, len(self._log_rows))
+        insert, end, shown = self.logs_tree.insert, tk.END, self._log_rows
+        for log_id, created_at, note in logs:
+            iid = str(log_id)
+            if iid in shown:  # a note added since the last page shifted the offsets
+                continue
+            values = (created_at, note)
+            insert("", end, iid=iid, values=values)
+            shown[iid] = values
+        self._logs_exhausted = len(logs) < LOG_PAGE_SIZE
+
+    def _on_logs_scrolled(self, first, last):
+        # Pull in the next page once the bottom of the loaded rows comes into view
+        if float(last) >= 1.0 and not self._logs_exhausted:
+            self._load_more_logs()
 
     def get_selected_log_id(self):
+        # logs_tree only ever holds log rows, keyed by their db id
         sel = self.logs_tree.selection()
-        if not sel:
-            return None
-        iid = sel[0]
-        if not iid.startswith("log-"):
-            return None
-        return int(iid.split("-", 1)[1])
+        return int(sel[0]) if sel else None
 
     def add_log_dialog(self):
         db_id = self.get_selected_printer_db_id()
@@ -516,7 +753,7 @@ class PrinterServiceApp(tk.Tk):
             messagebox.showwarning("No selection", "Select a note to edit.")
             return
         # preload existing text
-        note_text = self.logs_tree.item(f"log-{log_id}", "values")[1]
+        note_text = self._log_rows[str(log_id)][1]
         self._open_log_editor(
             title="Edit Service Note",
             initial=note_text,
@@ -550,17 +787,19 @@ class PrinterServiceApp(tk.Tk):
         dlg.title(title)
         dlg.grab_set()
         dlg.transient(self)
-        dlg.geometry("680x460")
-        dlg.minsize(620, 380)
+        scale = self._dpi_scale
+        dlg.geometry(f"{round(680 * scale)}x{round(460 * scale)}")
+        dlg.minsize(round(620 * scale), round(380 * scale))
+
+        # Pack the buttons first so the text area, not the buttons, shrinks
+        btns = ttk.Frame(dlg)
+        btns.pack(side=tk.BOTTOM, fill=tk.X, padx=8, pady=8)
 
         txt = tk.Text(dlg, wrap=tk.WORD)
         txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
         if initial:
             txt.insert("1.0", initial)
 
-        btns = ttk.Frame(dlg)
-        btns.pack(fill=tk.X, padx=8, pady=8)
-
         def submit():
             on_submit(txt.get("1.0", tk.END).strip())
             dlg.destroy()
@@ -568,18 +807,14 @@ class PrinterServiceApp(tk.Tk):
         ttk.Button(btns, text="OK", command=submit).pack(side=tk.RIGHT)
         ttk.Button(btns, text="Cancel", command=dlg.destroy).pack(side=tk.RIGHT, padx=(0, 8))
 
-        # Ensure the dialog is large enough to show buttons even on high DPI
-        dlg.update_idletasks()
-        req_w = max(dlg.winfo_reqwidth(), 680)
-        req_h = max(dlg.winfo_reqheight(), 420)
-        dlg.minsize(req_w, req_h)
-        dlg.geometry(f"{req_w}x{req_h}")
-
 
 def main():
-    initialize_database()
     app = PrinterServiceApp()
-    app.mainloop()
+    app.initialize_in_background()
+    try:
+        app.mainloop()
+    finally:
+        reset_connection()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 from pathlib import Path
+import sqlite3
 import sys
+import threading
 
 import pytest
 
@@ -12,8 +14,10 @@ import app
 def fresh_database(tmp_path, monkeypatch):
     db_path = tmp_path / "printer_service.db"
     monkeypatch.setattr(app, "DB_FILE", str(db_path))
+    app.reset_connection()
     app.initialize_database()
     yield
+    app.reset_connection()
 
 
 def _create_sample_printer(name="Printer 1", printer_id="printer-1", **overrides):
@@ -72,3 +76,149 @@ def test_log_crud_and_cascade_delete():
 
     assert remaining_logs == 0
     assert remaining_printers == 0
+
+
+def test_get_connection_reuses_shared_connection():
+    assert app.get_connection() is app.get_connection()
+    assert app.get_connection().execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_reopened_connection_keeps_foreign_keys_enabled():
+    app.reset_connection()
+    assert app.get_connection().execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_initialize_database_enables_wal():
+    conn = app.get_connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_fetch_logs_for_uses_index_without_sorting():
+    plan = app.get_connection().execute(
+        "EXPLAIN QUERY PLAN " + app._FETCH_LOGS_SQL,
+        (1, 10, 0),
+    ).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    assert "idx_logs_printer_created_id" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_ensure_unique_printer_id_fills_first_free_suffix():
+    for printer_id in ("machine", "machine-3", "machine-x", "machinery"):
+        app.db_insert_printer(printer_id, printer_id, "Maker", "Model", 0, "", False)
+    assert app.ensure_unique_printer_id("machine") == "machine-2"
+
+
+def test_fetch_logs_for_pages_newest_first():
+    printer_db_id, *_ = _create_sample_printer()
+    for i in range(5):
+        app.db_insert_log(printer_db_id, f"note {i}")
+
+    first_page = app.db_fetch_logs_for(printer_db_id, 2)
+    second_page = app.db_fetch_logs_for(printer_db_id, 2, 2)
+    rest = app.db_fetch_logs_for(printer_db_id, 2, 4)
+
+    notes = [row[2] for row in first_page + second_page + rest]
+    assert notes == ["note 4", "note 3", "note 2", "note 1", "note 0"]
+
+
+def test_data_version_tracks_commits_from_other_connections():
+    before = app.db_data_version()
+    app.db_insert_printer("own", "Own write", "", "", 0, "", False)
+    assert app.db_data_version() == before
+
+    other = sqlite3.connect(app.DB_FILE)
+    with other:
+        other.execute("INSERT INTO printers (printer_id, name) VALUES ('other', 'Other write')")
+    other.close()
+    assert app.db_data_version() != before
+
+
+def test_duplicate_printer_copies_row_with_unique_id():
+    printer_db_id, *_ = _create_sample_printer(printer_id="machine", name="Printer", hours=12, ams=True)
+
+    assert app.db_duplicate_printer(printer_db_id) == "machine-copy"
+    assert app.db_duplicate_printer(printer_db_id) == "machine-copy-2"
+    assert app.db_duplicate_printer(printer_db_id + 100) is None
+
+    copies = [row for row in app.db_fetch_printers() if row[1].startswith("machine-copy")]
+    assert [row[2] for row in copies] == ["Printer (Copy)", "Printer (Copy)"]
+    assert all(row[5] == 12 and row[7] == 1 for row in copies)
+
+
+def test_insert_printers_many_is_all_or_nothing():
+    app.db_insert_printers_many(
+        [("p-%d" % i, "Printer %d" % i, "Maker", "Model", i, "", False) for i in range(3)]
+    )
+    assert len(app.db_fetch_printers()) == 3
+
+    with pytest.raises(sqlite3.IntegrityError):
+        app.db_insert_printers_many(
+            [("p-new", "New", "", "", 0, "", False), ("p-0", "Clash", "", "", 0, "", False)]
+        )
+    assert len(app.db_fetch_printers()) == 3
+
+
+def test_update_printer_returns_stored_row():
+    printer_db_id, *_ = _create_sample_printer()
+    row = app.db_update_printer(printer_db_id, " printer-1 ", "Renamed ", "Maker", "Model X", "7", None, True)
+    assert row == (printer_db_id, "printer-1", "Renamed", "Maker", "Model X", 7, "", 1)
+    assert app.db_fetch_printers()[0] == row
+
+
+def test_initialize_database_migrates_old_printers_table(tmp_path, monkeypatch):
+    db_path = tmp_path / "old.db"
+    old = sqlite3.connect(db_path)
+    old.execute(
+        "CREATE TABLE printers (id INTEGER PRIMARY KEY AUTOINCREMENT, printer_id TEXT NOT NULL UNIQUE, "
+        "name TEXT NOT NULL, manufacturer TEXT, model TEXT, hours INTEGER DEFAULT 0)"
+    )
+    old.execute("INSERT INTO printers (printer_id, name) VALUES ('legacy', 'Legacy')")
+    old.commit()
+    old.close()
+
+    monkeypatch.setattr(app, "DB_FILE", str(db_path))
+    app.reset_connection()
+    app.initialize_database()
+    app.initialize_database()
+
+    assert app.db_fetch_printers()[0][1:] == ("legacy", "Legacy", None, None, 0, None, 0)
+
+
+def test_insert_logs_many_adds_all_notes():
+    printer_db_id, *_ = _create_sample_printer()
+    app.db_insert_logs_many(printer_db_id, [" first ", "second", "third"])
+
+    notes = sorted(row[2] for row in app.db_fetch_logs_for(printer_db_id))
+    assert notes == ["first", "second", "third"]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        app.db_insert_logs_many(printer_db_id + 100, ["orphan"])
+    assert len(app.db_fetch_logs_for(printer_db_id)) == 3
+
+
+def test_failed_commit_does_not_leave_transaction_open():
+    with pytest.raises(sqlite3.IntegrityError):
+        with app.transaction() as conn:
+            # A deferred foreign key violation only surfaces at COMMIT
+            conn.execute("PRAGMA defer_foreign_keys = ON;")
+            conn.execute("INSERT INTO service_logs (printer_id_fk, note) VALUES (999, 'orphan')")
+    assert not app.get_connection().in_transaction
+
+    app.db_insert_printer("after", "After", "", "", 0, "", False)
+    app.reset_connection()
+    assert [row[1] for row in app.db_fetch_printers()] == ["after"]
+
+
+def test_initialize_database_uses_its_own_connection(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "DB_FILE", str(tmp_path / "threaded.db"))
+    app.reset_connection()
+
+    worker = threading.Thread(target=app.initialize_database)
+    worker.start()
+    worker.join()
+
+    assert app._CONN is None
+    app.db_insert_printer("p-1", "Printer", "", "", 0, "", False)
+    assert [row[1] for row in app.db_fetch_printers()] == ["p-1"]